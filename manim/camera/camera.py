@@ -777,7 +777,11 @@ class Camera:
         Camera
             The camera object.
         """
-        self.set_cairo_context_color(ctx, self.get_fill_rgbas(vmobject), vmobject)
+        rgbas = self.get_fill_rgbas(vmobject)
+        if not rgbas[:, 3].any():
+            # A fully transparent fill draws nothing
+            return self
+        self.set_cairo_context_color(ctx, rgbas, vmobject)
         ctx.fill_preserve()
         return self
 
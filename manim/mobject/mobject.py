@@ -2224,9 +2224,15 @@ class Mobject:
         traversal of the submobjects.
         """
         result = getattr(self, array_attr)
-        for submob in self.submobjects:
-            result = np.append(result, submob.get_merged_array(array_attr), axis=0)
-        return result
+        if not self.submobjects:
+            return result
+        # Gather the arrays of the whole tree first and concatenate them
+        # once, rather than reallocating the result for every submobject.
+        arrays = [
+            result,
+            *(submob.get_merged_array(array_attr) for submob in self.submobjects),
+        ]
+        return np.concatenate(arrays, axis=0)
 
     def get_all_points(self) -> Point3D_Array:
         """Return all points from this mobject and all submobjects.
@@ -11,9 +11,10 @@ __all__ = [
     "DashedVMobject",
 ]
 
-import itertools as it
 import sys
+import weakref
 from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import numpy as np
@@ -29,6 +30,8 @@ from manim.mobject.three_d.three_d_utils import (
     get_3d_vmob_gradient_start_and_end_points,
 )
 from manim.utils.bezier import (
+    _bezier_remap_groups,
+    _get_portion_matrix,
     bezier,
     bezier_remap,
     get_smooth_cubic_bezier_handle_points,
@@ -44,6 +47,7 @@ from manim.utils.iterables import (
     stretch_array_to_length,
     tuplify,
 )
+from manim.utils.simple_functions import choose
 from manim.utils.space_ops import rotate_vector, shoelace_direction
 
 if TYPE_CHECKING:
@@ -53,7 +57,6 @@ if TYPE_CHECKING:
 
     from manim.typing import (
         CubicBezierPath,
-        CubicBezierPointsLike,
         CubicSpline,
         FloatRGBA,
         FloatRGBA_Array,
@@ -76,6 +79,57 @@ if TYPE_CHECKING:
 # - Think about length of self.points.  Always 0 or 1 mod 4?
 #   That's kind of weird.
 
+# Points arrays written by VMobject.append_points, by their id. Each of them
+# is a view into a larger buffer with spare capacity at its end. Entries are
+# dropped as soon as the view is garbage collected, e.g. after the points of
+# its mobject were replaced, so that the buffer is not kept alive.
+_growable_points: weakref.WeakValueDictionary[int, npt.NDArray[np.float64]] = (
+    weakref.WeakValueDictionary()
+)
+
+
+@lru_cache(maxsize=8)
+def _get_bezier_t_values(n_points_per_cubic_curve: int) -> npt.NDArray[np.float64]:
+    """Return the evenly spaced values of ``t`` in :math:`[0, 1]`, one per
+    control point of a Bézier curve. The array is shared between all
+    :class:`VMobject` instances and is therefore read-only.
+    """
+    t_values = np.linspace(0, 1, n_points_per_cubic_curve)
+    t_values.flags.writeable = False
+    return t_values
+
+
+@lru_cache(maxsize=8)
+def _get_line_weights(n_points_per_cubic_curve: int) -> npt.NDArray[np.float64]:
+    """Return the weights ``[1 - t, t]`` of the start and end point of a
+    straight line for every control point of a Bézier curve tracing it, as an
+    array of shape ``(n_points_per_cubic_curve, 2)``. Like
+    :func:`_get_bezier_t_values`, the array is shared and read-only.
+    """
+    t_values = _get_bezier_t_values(n_points_per_cubic_curve)
+    weights = np.stack([1 - t_values, t_values], axis=1)
+    weights.flags.writeable = False
+    return weights
+
+
+@lru_cache(maxsize=16)
+def _get_bezier_sampling_matrix(
+    n_points: int, sample_points: int
+) -> npt.NDArray[np.float64]:
+    """Return the matrix of shape ``(sample_points, n_points)`` whose rows hold
+    the Bernstein basis of a Bézier curve with ``n_points`` control points,
+    evaluated at ``sample_points`` evenly spaced values of ``t`` in
+    :math:`[0, 1]`. Multiplying it with the control points of a curve samples
+    the curve at all those values at once. The array is shared and read-only.
+    """
+    degree = n_points - 1
+    t = np.linspace(0, 1, sample_points)[:, np.newaxis]
+    k = np.arange(n_points)
+    coefficients = np.array([choose(degree, i) for i in range(n_points)], dtype=float)
+    matrix = coefficients * (1 - t) ** (degree - k) * t**k
+    matrix.flags.writeable = False
+    return matrix
+
 
 class VMobject(Mobject):
     """A vectorized mobject.
@@ -133,8 +187,10 @@ class VMobject(Mobject):
         self.stroke_opacity = stroke_opacity
         self.stroke_width = stroke_width
         if background_stroke_color is not None:
-            self.background_stroke_color: ManimColor = ManimColor(
+            self.background_stroke_color: ManimColor = (
                 background_stroke_color
+                if isinstance(background_stroke_color, ManimColor)
+                else ManimColor(background_stroke_color)
             )
         self.background_stroke_opacity: float = background_stroke_opacity
         self.background_stroke_width: float = background_stroke_width
@@ -154,9 +210,6 @@ class VMobject(Mobject):
         self.shade_in_3d: bool = shade_in_3d
         self.tolerance_for_point_equality: float = tolerance_for_point_equality
         self.n_points_per_cubic_curve: int = n_points_per_cubic_curve
-        self._bezier_t_values: npt.NDArray[np.float64] = np.linspace(
-            0, 1, n_points_per_cubic_curve
-        )
         self.cap_style: CapStyleType = cap_style
         super().__init__(**kwargs)
         self.submobjects: list[VMobject]
@@ -166,9 +219,17 @@ class VMobject(Mobject):
         #     fill_color = kwargs["color"]
         #     stroke_color = kwargs["color"]
         if fill_color is not None:
-            self.fill_color = ManimColor.parse(fill_color)
+            self.fill_color = (
+                fill_color
+                if isinstance(fill_color, ManimColor)
+                else ManimColor.parse(fill_color)
+            )
         if stroke_color is not None:
-            self.stroke_color = ManimColor.parse(stroke_color)
+            self.stroke_color = (
+                stroke_color
+                if isinstance(stroke_color, ManimColor)
+                else ManimColor.parse(stroke_color)
+            )
 
     def _assert_valid_submobjects(self, submobjects: Iterable[VMobject]) -> Self:
         return self._assert_valid_submobjects_internal(submobjects, VMobject)
@@ -181,6 +242,12 @@ class VMobject(Mobject):
     def n_points_per_curve(self) -> int:
         return self.n_points_per_cubic_curve
 
+    @property
+    def _bezier_t_values(self) -> npt.NDArray[np.float64]:
+        # Looked up in the shared cache instead of being stored on every
+        # instance, where it would be duplicated by each deepcopy.
+        return _get_bezier_t_values(self.n_points_per_cubic_curve)
+
     def get_group_class(self) -> type[VGroup]:
         return VGroup
 
@@ -190,28 +257,33 @@ class VMobject(Mobject):
 
     # Colors
     def init_colors(self, propagate_colors: bool = True) -> Self:
-        self.set_fill(
-            color=self.fill_color,
-            opacity=self.fill_opacity,
-            family=propagate_colors,
-        )
-        self.set_stroke(
-            color=self.stroke_color,
-            width=self.stroke_width,
-            opacity=self.stroke_opacity,
-            family=propagate_colors,
-        )
-        self.set_background_stroke(
-            color=self.background_stroke_color,
-            width=self.background_stroke_width,
-            opacity=self.background_stroke_opacity,
-            family=propagate_colors,
-        )
-        self.set_sheen(
-            factor=self.sheen_factor,
-            direction=self.sheen_direction,
-            family=propagate_colors,
-        )
+        fill_color = self.fill_color
+        stroke_color = self.stroke_color
+        # Apply the whole style to each family member in a single pass,
+        # rather than having every setter traverse the family on its own.
+        for mob in self.get_family() if propagate_colors else [self]:
+            mob.set_fill(
+                color=fill_color,
+                opacity=self.fill_opacity,
+                family=False,
+            )
+            mob.set_stroke(
+                color=stroke_color,
+                width=self.stroke_width,
+                opacity=self.stroke_opacity,
+                family=False,
+            )
+            mob.set_background_stroke(
+                color=self.background_stroke_color,
+                width=self.background_stroke_width,
+                opacity=self.background_stroke_opacity,
+                family=False,
+            )
+            mob.set_sheen(
+                factor=self.sheen_factor,
+                direction=self.sheen_direction,
+                family=False,
+            )
 
         if not propagate_colors:
             for submobject in self.submobjects:
@@ -232,24 +304,37 @@ class VMobject(Mobject):
         will automatically be added for the gradient
         """
         colors: list[ManimColor] = [
-            ManimColor(c) if (c is not None) else BLACK for c in tuplify(color)
+            BLACK if c is None else c if isinstance(c, ManimColor) else ManimColor(c)
+            for c in tuplify(color)
         ]
         opacities: list[float] = [
             o if (o is not None) else 0.0 for o in tuplify(opacity)
         ]
+        # Stack the stored rgba arrays of the colors in one go, then
+        # overwrite the whole alpha column, instead of building a fresh
+        # array per color with to_rgba_with_alpha. Both are stretched to
+        # the same length with the index pattern of make_even. The dtype is
+        # pinned to float64: rows are handed back to ManimColor, which only
+        # reads arrays of Python-float compatible values as float channels.
         rgbas: FloatRGBA_Array = np.array(
-            [
-                c.to_rgba_with_alpha(o)
-                for c, o in zip(*make_even(colors, opacities), strict=True)
-            ],
+            [c.to_rgba() for c in colors], dtype=np.float64
         )
+        alphas = np.array(opacities, dtype=float)
+        length = max(len(rgbas), len(alphas))
+        if len(rgbas) != length:
+            rgbas = rgbas[np.arange(length) * len(rgbas) // length]
+        if len(alphas) != length:
+            alphas = alphas[np.arange(length) * len(alphas) // length]
+        rgbas[:, 3] = alphas
 
         sheen_factor = self.get_sheen_factor()
         if sheen_factor != 0 and len(rgbas) == 1:
-            light_rgbas = np.array(rgbas)
-            light_rgbas[:, :3] += sheen_factor
-            np.clip(light_rgbas, 0, 1, out=light_rgbas)
-            rgbas = np.append(rgbas, light_rgbas, axis=0)
+            # Duplicate the single row, then lighten the rgb channels of the
+            # copy in place. The alpha channel is left untouched.
+            rgbas = np.repeat(rgbas, 2, axis=0)
+            light_rgb = rgbas[1, :3]
+            light_rgb += sheen_factor
+            np.clip(light_rgb, 0, 1, out=light_rgb)
         return rgbas
 
     def update_rgbas_array(
@@ -258,6 +343,23 @@ class VMobject(Mobject):
         color: ParsableManimColor | Iterable[ManimColor] | None = None,
         opacity: float | None = None,
     ) -> Self:
+        # Fast path for the most common case: a single solid color and a
+        # single opacity written over a single rgba row, without sheen.
+        if (
+            self.get_sheen_factor() == 0
+            and (color is None or isinstance(color, (ManimColor, str)))
+            and (opacity is None or isinstance(opacity, (int, float)))
+            and len(getattr(self, array_name, ())) == 1
+        ):
+            curr_rgbas = getattr(self, array_name)
+            if color is not None:
+                if not isinstance(color, ManimColor):
+                    color = ManimColor(color)
+                curr_rgbas[0, :3] = color.to_rgb()
+            if opacity is not None:
+                curr_rgbas[0, 3] = opacity
+            return self
+
         rgbas = self.generate_rgbas_array(color, opacity)
         if not hasattr(self, array_name):
             setattr(self, array_name, rgbas)
@@ -268,7 +370,9 @@ class VMobject(Mobject):
         if len(curr_rgbas) < len(rgbas):
             curr_rgbas = stretch_array_to_length(curr_rgbas, len(rgbas))
             setattr(self, array_name, curr_rgbas)
-        elif len(rgbas) < len(curr_rgbas):
+        elif 1 < len(rgbas) < len(curr_rgbas):
+            # A single row is broadcast over curr_rgbas by the assignments
+            # below and does not need to be stretched into a new array.
             rgbas = stretch_array_to_length(rgbas, len(curr_rgbas))
         # Only update rgb if color was not None, and only
         # update alpha channel if opacity was passed in
@@ -319,7 +423,7 @@ class VMobject(Mobject):
         --------
         :meth:`~.VMobject.set_style`
         """
-        if family:
+        if family and self.submobjects:
             for submobject in self.submobjects:
                 submobject.set_fill(color, opacity, family)
         self.update_rgbas_array("fill_rgbas", color, opacity)
@@ -336,7 +440,7 @@ class VMobject(Mobject):
         background=False,
         family: bool = True,
     ) -> Self:
-        if family:
+        if family and self.submobjects:
             for submobject in self.submobjects:
                 submobject.set_stroke(color, width, opacity, background, family)
         if background:
@@ -353,7 +457,9 @@ class VMobject(Mobject):
         if opacity is not None:
             setattr(self, opacity_name, opacity)
         if color is not None and background:
-            if isinstance(color, (list, tuple)):
+            if isinstance(color, ManimColor):
+                self.background_stroke_color = color
+            elif isinstance(color, (list, tuple)):
                 self.background_stroke_color = ManimColor.parse(color)
             else:
                 self.background_stroke_color = ManimColor(color)
@@ -407,19 +513,22 @@ class VMobject(Mobject):
         background_image: Image | str | None = None,
         family: bool = True,
     ) -> Self:
-        self.set_fill(color=fill_color, opacity=fill_opacity, family=family)
-        self.set_stroke(
-            color=stroke_color,
-            width=stroke_width,
-            opacity=stroke_opacity,
-            family=family,
-        )
-        self.set_background_stroke(
-            color=background_stroke_color,
-            width=background_stroke_width,
-            opacity=background_stroke_opacity,
-            family=family,
-        )
+        # Walk the family once and update every member locally, instead of
+        # letting each of the setters below traverse the family on its own.
+        for mob in self.get_family() if family and self.submobjects else [self]:
+            mob.set_fill(color=fill_color, opacity=fill_opacity, family=False)
+            mob.set_stroke(
+                color=stroke_color,
+                width=stroke_width,
+                opacity=stroke_opacity,
+                family=False,
+            )
+            mob.set_background_stroke(
+                color=background_stroke_color,
+                width=background_stroke_width,
+                opacity=background_stroke_opacity,
+                family=False,
+            )
         if sheen_factor:
             self.set_sheen(
                 factor=sheen_factor,
@@ -470,14 +579,16 @@ class VMobject(Mobject):
         return self
 
     def set_color(self, color: ParsableManimColor, family: bool = True) -> Self:
-        self.set_fill(color, family=family)
-        self.set_stroke(color, family=family)
+        for mob in self.get_family() if family and self.submobjects else [self]:
+            mob.set_fill(color, family=False)
+            mob.set_stroke(color, family=False)
         return self
 
     def set_opacity(self, opacity: float, family: bool = True) -> Self:
-        self.set_fill(opacity=opacity, family=family)
-        self.set_stroke(opacity=opacity, family=family)
-        self.set_stroke(opacity=opacity, family=family, background=True)
+        for mob in self.get_family() if family and self.submobjects else [self]:
+            mob.set_fill(opacity=opacity, family=False)
+            mob.set_stroke(opacity=opacity, family=False)
+            mob.set_stroke(opacity=opacity, family=False, background=True)
         return self
 
     def scale(
@@ -589,9 +700,11 @@ class VMobject(Mobject):
     # TODO: Does this just do a copy?
     # TODO: I have the feeling that this function should not return None, does that have any usage ?
     def get_fill_colors(self) -> list[ManimColor | None]:
+        rgbas = self.get_fill_rgbas()
+        nonzero = rgbas.any(axis=1)
         return [
-            ManimColor(rgba[:3]) if rgba.any() else None
-            for rgba in self.get_fill_rgbas()
+            ManimColor(rgb) if is_nonzero else None
+            for rgb, is_nonzero in zip(rgbas[:, :3], nonzero, strict=True)
         ]
 
     def get_fill_opacities(self) -> npt.NDArray[ManimFloat]:
@@ -627,9 +740,11 @@ class VMobject(Mobject):
         return self.get_stroke_opacities(background)[0]
 
     def get_stroke_colors(self, background: bool = False) -> list[ManimColor | None]:
+        rgbas = self.get_stroke_rgbas(background)
+        nonzero = rgbas.any(axis=1)
         return [
-            ManimColor(rgba[:3]) if rgba.any() else None
-            for rgba in self.get_stroke_rgbas(background)
+            ManimColor(rgb) if is_nonzero else None
+            for rgb, is_nonzero in zip(rgbas[:, :3], nonzero, strict=True)
         ]
 
     def get_stroke_opacities(self, background: bool = False) -> npt.NDArray[ManimFloat]:
@@ -673,7 +788,7 @@ class VMobject(Mobject):
         :meth:`~.VMobject.rotate_sheen_direction`
         """
         direction_copy = np.array(direction)
-        if family:
+        if family and self.submobjects:
             for submob in self.get_family():
                 submob.sheen_direction = direction_copy.copy()
         else:
@@ -702,7 +817,9 @@ class VMobject(Mobject):
         --------
         :meth:`~.VMobject.set_sheen_direction`
         """
-        if family:
+        if angle == 0:
+            return self
+        if family and self.submobjects:
             for submob in self.get_family():
                 submob.sheen_direction = rotate_vector(
                     submob.sheen_direction,
@@ -737,7 +854,13 @@ class VMobject(Mobject):
                     circle = Circle(fill_opacity=1).set_sheen(-0.3, DR)
                     self.add(circle)
         """
-        if family:
+        if factor == 0 and direction is None:
+            # Without a direction and with no sheen to put into effect, the
+            # colors are left as is, and only the factor has to be stored.
+            for submob in self.get_family() if family and self.submobjects else [self]:
+                submob.sheen_factor = factor
+            return self
+        if family and self.submobjects:
             for submob in self.submobjects:
                 submob.set_sheen(factor, direction, family)
         self.sheen_factor: float = factor
@@ -752,7 +875,12 @@ class VMobject(Mobject):
         return self
 
     def get_sheen_direction(self) -> Vector3D:
-        return np.array(self.sheen_direction)
+        """Return the direction of the sheen.
+
+        This is the stored array itself rather than a copy, so it should not
+        be modified in place: use :meth:`set_sheen_direction` instead.
+        """
+        return self.sheen_direction
 
     def get_sheen_factor(self) -> float:
         return self.sheen_factor
@@ -762,11 +890,17 @@ class VMobject(Mobject):
             return get_3d_vmob_gradient_start_and_end_points(self)
         else:
             direction = self.get_sheen_direction()
-            c = self.get_center()
-            bases = np.array(
-                [self.get_edge_center(vect) - c for vect in [RIGHT, UP, OUT]],
-            ).transpose()
-            offset = np.dot(bases, direction)
+            # The bounding box is computed once: its center, and the offsets
+            # from it to the edge centers along RIGHT, UP and OUT, which are
+            # the half-extents of the box along each axis.
+            points = self.get_points_defining_boundary()
+            if len(points) == 0:
+                c = np.zeros(self.dim)
+                return (c, c.copy())
+            mins = points.min(axis=0)
+            maxs = points.max(axis=0)
+            c = (mins + maxs) / 2
+            offset = (maxs - mins) / 2 * direction
             return (c - offset, c + offset)
 
     def color_using_background_image(self, background_image: Image | str) -> Self:
@@ -840,13 +974,20 @@ class VMobject(Mobject):
         assert len(anchors1) == len(handles1) == len(handles2) == len(anchors2)
         nppcc = self.n_points_per_cubic_curve  # 4
         total_len = nppcc * len(anchors1)
-        self.points = np.empty((total_len, self.dim))
         # the following will, from the four sets, dispatch them in points such that
         # self.points = [
         #     anchors1[0], handles1[0], handles2[0], anchors1[0], anchors1[1],
         #     handles1[1], ...
         # ]
         arrays = [anchors1, handles1, handles2, anchors2]
+        if nppcc == 4:
+            # Stacking along axis 1 interleaves the four sets in a single
+            # contiguous write instead of four strided ones.
+            self.points = np.stack(arrays, axis=1, dtype=float).reshape(
+                total_len, self.dim
+            )
+            return self
+        self.points = np.empty((total_len, self.dim))
         for index, array in enumerate(arrays):
             self.points[index::nppcc] = array
         return self
@@ -868,15 +1009,38 @@ class VMobject(Mobject):
         -------
         :class:`VMobject`
             The VMobject itself, after appending ``new_points``.
+
+        Notes
+        -----
+        When a path is built incrementally, :attr:`VMobject.points` is a view
+        into a larger buffer whose capacity grows geometrically, so that
+        repeated calls only copy the new points. As soon as
+        :attr:`VMobject.points` is reassigned by any other means, the next
+        call falls back to allocating a fresh buffer, and the old one is
+        released once nothing else refers to it.
         """
         # TODO, check that number new points is a multiple of 4?
         # or else that if len(self.points) % 4 == 1, then
         # len(new_points) % 4 == 3?
-        n = len(self.points)
-        points = np.empty((n + len(new_points), self.dim))
-        points[:n] = self.points
-        points[n:] = new_points
-        self.points = points
+        points = self.points
+        n = len(points)
+        needed = n + len(new_points)
+        buffer = points.base
+        # Only write into the spare capacity of a buffer which was allocated
+        # here. Removing the entry of points ensures that, if the view is
+        # shared with another mobject, only one of them can grow into it.
+        if (
+            _growable_points.pop(id(points), None) is points
+            and buffer is not None
+            and len(buffer) >= needed
+        ):
+            buffer[n:needed] = new_points
+        else:
+            buffer = np.empty((max(needed, 2 * n), self.dim))
+            buffer[:n] = points
+            buffer[n:needed] = new_points
+        self.points = buffer[:needed]
+        _growable_points[id(self.points)] = self.points
         return self
 
     def start_new_path(self, point: Point3DLike) -> Self:
@@ -902,9 +1066,10 @@ class VMobject(Mobject):
         if n_points % nppc != 0:
             # close the open path by appending the last
             # start anchor sufficiently often
-            last_anchor = self.get_start_anchors()[-1]
-            closure = [last_anchor] * (nppc - (n_points % nppc))
-            self.append_points(closure + [point])
+            new_points = np.empty((nppc - (n_points % nppc) + 1, self.dim))
+            new_points[:-1] = self.get_start_anchors()[-1]
+            new_points[-1] = point
+            self.append_points(new_points)
         else:
             self.append_points([point])
         return self
@@ -950,11 +1115,16 @@ class VMobject(Mobject):
             ``self``
         """
         self.throw_error_if_no_points()
-        new_points = [handle1, handle2, anchor]
+        # Fill the curve into a single block, instead of building a list of
+        # points for append_points to convert.
+        new_points = np.empty((4, self.dim))
+        new_points[0] = self.get_last_point()
+        new_points[1] = handle1
+        new_points[2] = handle2
+        new_points[3] = anchor
         if self.has_new_path_started():
-            self.append_points(new_points)
-        else:
-            self.append_points([self.get_last_point()] + new_points)
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return self
 
     def add_quadratic_bezier_curve_to(
@@ -976,11 +1146,16 @@ class VMobject(Mobject):
         # 2. Place the 2 middle control points 2/3 along the line segments
         # from the end points to the quadratic curve's middle control point.
         # I think that's beautiful.
-        self.add_cubic_bezier_curve_to(
-            2 / 3 * handle + 1 / 3 * self.get_last_point(),
-            2 / 3 * handle + 1 / 3 * anchor,
-            anchor,
-        )
+        self.throw_error_if_no_points()
+        new_points = np.empty((4, self.dim))
+        new_points[0] = self.get_last_point()
+        new_points[3] = anchor
+        new_points[1:3] = (2 * np.asarray(handle) + new_points[[0, 3]]) / 3
+        # As in add_cubic_bezier_curve_to, the last point only has to be
+        # repeated if no new path has been started.
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return self
 
     def add_line_to(self, point: Point3DLike) -> Self:
@@ -997,12 +1172,19 @@ class VMobject(Mobject):
         :class:`VMobject`
             ``self``
         """
-        self.add_cubic_bezier_curve_to(
-            *(
-                interpolate(self.get_last_point(), point, t)
-                for t in self._bezier_t_values[1:]
-            )
-        )
+        self.throw_error_if_no_points()
+        nppcc = self.n_points_per_cubic_curve
+        # Fill the end points into the block of the new curve, and
+        # interpolate the handles between them with the inner line weights.
+        new_points = np.empty((nppcc, self.dim))
+        new_points[0] = self.get_last_point()
+        new_points[-1] = point
+        new_points[1:-1] = _get_line_weights(nppcc)[1:-1] @ new_points[[0, -1]]
+        # As in add_cubic_bezier_curve_to, the last point only has to be
+        # repeated if no new path has been started.
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return self
 
     def add_smooth_curve_to(self, *points: Point3DLike) -> Self:
@@ -1058,7 +1240,10 @@ class VMobject(Mobject):
 
     def is_closed(self) -> bool:
         # TODO use consider_points_equals_2d ?
-        return self.consider_points_equals(self.points[0], self.points[-1])
+        # Fetch both end points with a single indexing operation and compare
+        # their coordinates as floats.
+        start, end = self.points[[0, -1]].tolist()
+        return self._consider_coordinates_equals(start, end)
 
     def close_path(self) -> Self:
         if not self.is_closed():
@@ -1090,21 +1275,21 @@ class VMobject(Mobject):
         if num_points == 0:
             return self
 
-        start_corners = np.empty((num_points, self.dim))
-        start_corners[0] = self.points[-1]
-        start_corners[1:] = points[:-1]
-        end_corners = points
+        # Pair up the start and end corner of every new line
+        segments = np.empty((num_points, 2, self.dim))
+        segments[0, 0] = self.points[-1]
+        segments[1:, 0] = points[:-1]
+        segments[:, 1] = points
 
         if self.has_new_path_started():
             # Remove the last point from the new path
             self.points = self.points[:-1]
 
-        nppcc = self.n_points_per_cubic_curve
-        new_points = np.empty((nppcc * start_corners.shape[0], self.dim))
-        new_points[::nppcc] = start_corners
-        new_points[nppcc - 1 :: nppcc] = end_corners
-        for i, t in enumerate(self._bezier_t_values):
-            new_points[i::nppcc] = interpolate(start_corners, end_corners, t)
+        # The weights at t = 0 and t = 1 reproduce the corners exactly, so
+        # a single product yields all the control points, interleaved.
+        new_points = (
+            _get_line_weights(self.n_points_per_cubic_curve) @ segments
+        ).reshape(-1, self.dim)
 
         self.append_points(new_points)
         return self
@@ -1149,11 +1334,17 @@ class VMobject(Mobject):
                     self.add(vmob)
         """
         points = np.array(points)
+        if len(points) < 2:
+            return self.clear_points()
         # This will set the handles aligned with the anchors.
         # Id est, a bezier curve will be the segment from the two anchors such that the handles belongs to this segment.
-        self.set_anchors_and_handles(
-            *(interpolate(points[:-1], points[1:], t) for t in self._bezier_t_values)
-        )
+        # Multiplying the line weights with every pair of consecutive corners
+        # yields the control points of all the curves in one go, already
+        # in the order in which they are stored in self.points.
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        self.points = (
+            _get_line_weights(self.n_points_per_cubic_curve) @ segments
+        ).reshape(-1, self.dim)
         return self
 
     def set_points_smoothly(self, points: Point3DLike_Array) -> Self:
@@ -1174,25 +1365,34 @@ class VMobject(Mobject):
         assert mode in ["jagged", "smooth"], 'mode must be either "jagged" or "smooth"'
         nppcc = self.n_points_per_cubic_curve
         for submob in self.family_members_with_points():
+            # The subpaths are views of the points, and the handles are
+            # written into them in place. Their reshape below is only
+            # guaranteed to be a view for contiguous points.
+            if not submob.points.flags.c_contiguous:
+                submob.points = np.ascontiguousarray(submob.points)
             subpaths = submob.get_subpaths()
-            submob.clear_points()
             # A subpath can be composed of several bezier curves.
             for subpath in subpaths:
                 # This will retrieve the anchors of the subpath, by selecting every n element in the array subpath
                 # The append is needed as the last element is not reached when slicing with numpy.
                 anchors = np.append(subpath[::nppcc], subpath[-1:], 0)
+                # Write the handles through a (curves, nppcc, dim) view
+                # of the subpath, one row of control points per curve.
+                curves = submob.gen_cubic_bezier_tuples_from_points(subpath)
                 if mode == "smooth":
                     h1, h2 = get_smooth_cubic_bezier_handle_points(anchors)
+                    curves[:, 1] = h1
+                    curves[:, 2] = h2
                 else:  # mode == "jagged"
                     # The following will make the handles aligned with the anchors, thus making the bezier curve a segment
-                    a1 = anchors[:-1]
-                    a2 = anchors[1:]
-                    h1 = interpolate(a1, a2, 1.0 / 3)
-                    h2 = interpolate(a1, a2, 2.0 / 3)
-                new_subpath = np.array(subpath)
-                new_subpath[1::nppcc] = h1
-                new_subpath[2::nppcc] = h2
-                submob.append_points(new_subpath)
+                    # Both handles of every curve are interpolated between
+                    # its anchors at once, with the inner line weights.
+                    segments = np.stack([anchors[:-1], anchors[1:]], axis=1)
+                    curves[:, 1:-1] = _get_line_weights(nppcc)[1:-1] @ segments
+            # The subpaths are consecutive and start at the first point.
+            # Only trailing points that do not form a complete curve are
+            # left out of them, and they are dropped.
+            submob.points = submob.points[: sum(len(subpath) for subpath in subpaths)]
         return self
 
     def make_smooth(self) -> Self:
@@ -1264,17 +1464,69 @@ class VMobject(Mobject):
             if len(submob.points) < self.n_points_per_cubic_curve:
                 # The case that a bezier quad is not complete (there is no bezier curve as there is not enough control points.)
                 continue
-            a1, h1, h2, a2 = submob.get_anchors_and_handles()
-            a1_to_h1 = h1 - a1
-            a2_to_h2 = h2 - a2
-            new_h1 = a1 + factor * a1_to_h1
-            new_h2 = a2 + factor * a2_to_h2
-            submob.set_anchors_and_handles(a1, new_h1, new_h2, a2)
+            # View of the points with one row of control points per curve,
+            # so the handles can be updated in place, curve by curve. The
+            # reshape is only guaranteed to be a view for contiguous points.
+            if not submob.points.flags.c_contiguous:
+                submob.points = np.ascontiguousarray(submob.points)
+            curves = submob.gen_cubic_bezier_tuples_from_points(submob.points)
+            a1, h1, h2, a2 = curves[:, 0], curves[:, 1], curves[:, 2], curves[:, 3]
+            # h1 = a1 + factor * (h1 - a1), and likewise for h2 and a2
+            for handle, anchor in ((h1, a1), (h2, a2)):
+                handle -= anchor
+                handle *= factor
+                handle += anchor
         return self
 
     #
     def consider_points_equals(self, p0: Point3DLike, p1: Point3DLike) -> bool:
-        return np.allclose(p0, p1, atol=self.tolerance_for_point_equality)
+        """Determine if two points are close enough to be considered equal.
+
+        For two single points, this uses the algorithm from np.allclose(),
+        but expanded here to plain float comparisons, which stop at the first
+        coordinate that differs. Anything else, like an array of points
+        compared to a point, is passed to np.allclose().
+
+        Parameters
+        ----------
+        p0
+            first point
+        p1
+            second point
+
+        Returns
+        -------
+        bool
+            whether two points considered close.
+        """
+        p0 = np.asarray(p0)
+        p1 = np.asarray(p1)
+        if p0.ndim != 1 or p0.shape != p1.shape:
+            return bool(np.allclose(p0, p1, atol=self.tolerance_for_point_equality))
+        return self._consider_coordinates_equals(p0.tolist(), p1.tolist())
+
+    def _consider_coordinates_equals(
+        self, coords0: Sequence[float], coords1: Sequence[float]
+    ) -> bool:
+        """Scalar version of np.allclose() with the tolerance of
+        :meth:`consider_points_equals`, for the coordinates of two points
+        given as sequences of Python floats.
+        """
+        atol = self.tolerance_for_point_equality
+        rtol = 1.0e-5  # default from np.allclose()
+        # Like np.isclose(), infinite coordinates are only close when equal.
+        return all(
+            c0 == c1 or abs(c0 - c1) <= atol + rtol * abs(c1) < np.inf
+            for c0, c1 in zip(coords0, coords1, strict=True)
+        )
+
+    def _consider_points_equals_mask(
+        self, p0s: Point3DLike_Array, p1s: Point3DLike_Array
+    ) -> npt.NDArray[np.bool_]:
+        """Vectorized version of :meth:`consider_points_equals`, which
+        compares two arrays of points row by row.
+        """
+        return np.isclose(p0s, p1s, atol=self.tolerance_for_point_equality).all(axis=-1)
 
     def consider_points_equals_2d(self, p0: Point2DLike, p1: Point2DLike) -> bool:
         """Determine if two points are close enough to be considered equal.
@@ -1299,6 +1551,32 @@ class VMobject(Mobject):
             return False
         return abs(p0[1] - p1[1]) <= atol + rtol * abs(p1[1])
 
+    def _consider_points_equals_2d_mask(
+        self, p0s: Point3DLike_Array, p1s: Point3DLike_Array
+    ) -> npt.NDArray[np.bool_]:
+        """Vectorized version of :meth:`consider_points_equals_2d`, which
+        compares two arrays of points row by row.
+
+        Parameters
+        ----------
+        p0s
+            first points
+        p1s
+            second points
+
+        Returns
+        -------
+        npt.NDArray[np.bool_]
+            whether each pair of points is considered close.
+        """
+        rtol = 1.0e-5  # default from np.isclose()
+        atol = self.tolerance_for_point_equality
+        p0s = np.asarray(p0s)[:, :2]
+        p1s = np.asarray(p1s)[:, :2]
+        tolerances = atol + rtol * np.abs(p1s)
+        diffs = np.abs(p0s - p1s)
+        return ~(diffs[:, 0] > tolerances[:, 0]) & (diffs[:, 1] <= tolerances[:, 1])
+
     # Information about line
     def get_cubic_bezier_tuples_from_points(
         self, points: CubicBezierPathLike
@@ -1307,7 +1585,7 @@ class VMobject(Mobject):
 
     def gen_cubic_bezier_tuples_from_points(
         self, points: CubicBezierPathLike
-    ) -> tuple[CubicBezierPointsLike, ...]:
+    ) -> CubicBezierPoints_Array:
         """Returns the bezier tuples from an array of points.
 
         self.points is a list of the anchors and handles of the bezier curves of the mobject (ie [anchor1, handle1, handle2, anchor2, anchor3 ..])
@@ -1322,14 +1600,16 @@ class VMobject(Mobject):
 
         Returns
         -------
-        tuple
-            Bezier control points.
+        CubicBezierPoints_Array
+            Bezier control points, as a view of ``points`` of shape
+            ``(number of curves, nppcc, dimension)``.
         """
         nppcc = self.n_points_per_cubic_curve
+        points = np.asarray(points)
         remainder = len(points) % nppcc
         points = points[: len(points) - remainder]
         # Basically take every nppcc element.
-        return tuple(points[i : i + nppcc] for i in range(0, len(points), nppcc))
+        return points.reshape(-1, nppcc, *points.shape[1:])
 
     def get_cubic_bezier_tuples(self) -> CubicBezierPoints_Array:
         return self.get_cubic_bezier_tuples_from_points(self.points)
@@ -1337,22 +1617,22 @@ class VMobject(Mobject):
     def _gen_subpaths_from_points(
         self,
         points: CubicBezierPath,
-        filter_func: Callable[[int], bool],
+        equals_func: Callable[[Point3D_Array, Point3D_Array], npt.NDArray[np.bool_]],
     ) -> Iterable[CubicSpline]:
         """Given an array of points defining the bezier curves of the vmobject, return subpaths formed by these points.
-        Here, Two bezier curves form a path if at least two of their anchors are evaluated True by the relation defined by filter_func.
+        Here, two consecutive bezier curves belong to the same subpath if the last anchor of the first one and the
+        first anchor of the second one are considered equal by equals_func.
 
-        The algorithm every bezier tuple (anchors and handles) in ``self.points`` (by regrouping each n elements, where
-        n is the number of points per cubic curve)), and evaluate the relation between two anchors with filter_func.
-        NOTE : The filter_func takes an int n as parameter, and will evaluate the relation between points[n] and points[n - 1]. This should probably be changed so
-        the function takes two points as parameters.
+        The algorithm regroups the points in ``points`` into bezier tuples (anchors and handles) of n elements, where
+        n is the number of points per cubic curve, and compares the anchors on both sides of every boundary between
+        two curves with a single call to equals_func.
 
         Parameters
         ----------
         points
             points defining the bezier curve.
-        filter_func
-            Filter-func defining the relation.
+        equals_func
+            Function comparing two arrays of points row by row, returning whether each pair is considered equal.
 
         Returns
         -------
@@ -1360,8 +1640,9 @@ class VMobject(Mobject):
             subpaths formed by the points.
         """
         nppcc = self.n_points_per_cubic_curve
-        filtered = filter(filter_func, range(nppcc, len(points), nppcc))
-        split_indices = [0] + list(filtered) + [len(points)]
+        boundaries = np.arange(nppcc, len(points), nppcc)
+        equals = equals_func(points[boundaries - 1], points[boundaries])
+        split_indices = [0, *boundaries[~equals].tolist(), len(points)]
         return (
             points[i1:i2]
             for i1, i2 in zip(split_indices[:-1], split_indices[1:], strict=True)
@@ -1370,18 +1651,14 @@ class VMobject(Mobject):
 
     def get_subpaths_from_points(self, points: CubicBezierPath) -> list[CubicSpline]:
         return list(
-            self._gen_subpaths_from_points(
-                points,
-                lambda n: not self.consider_points_equals(points[n - 1], points[n]),
-            ),
+            self._gen_subpaths_from_points(points, self._consider_points_equals_mask)
         )
 
     def gen_subpaths_from_points_2d(
         self, points: CubicBezierPath
     ) -> Iterable[CubicSpline]:
         return self._gen_subpaths_from_points(
-            points,
-            lambda n: not self.consider_points_equals_2d(points[n - 1], points[n]),
+            points, self._consider_points_equals_2d_mask
         )
 
     def get_subpaths(self) -> list[CubicSpline]:
@@ -1449,8 +1726,10 @@ class VMobject(Mobject):
         if sample_points is None:
             sample_points = 10
 
-        curve = self.get_nth_curve_function(n)
-        points = np.array([curve(a) for a in np.linspace(0, 1, sample_points)])
+        curve_points = self.get_nth_curve_points(n)
+        points = (
+            _get_bezier_sampling_matrix(len(curve_points), sample_points) @ curve_points
+        )
         diffs = points[1:] - points[:-1]
         norms = np.linalg.norm(diffs, axis=1)
 
@@ -1595,21 +1874,18 @@ class VMobject(Mobject):
         if alpha == 1:
             return self.points[-1]
 
-        curves_and_lengths = tuple(self.get_curve_functions_with_lengths())
-
-        target_length = alpha * sum(length for _, length in curves_and_lengths)
-        current_length = 0
-
-        for curve, length in curves_and_lengths:
-            if current_length + length >= target_length:
-                if length != 0:
-                    residue = (target_length - current_length) / length
-                else:
-                    residue = 0
-
-                return curve(residue)
+        lengths = self._get_curve_lengths()
+        cumulative_lengths = np.cumsum(lengths)
+        total_length = cumulative_lengths[-1] if len(lengths) > 0 else 0
+        target_length = alpha * total_length
 
-            current_length += length
+        # Binary search for the first curve whose end reaches the target length
+        n = int(np.searchsorted(cumulative_lengths, target_length))
+        if n < len(lengths):
+            current_length = cumulative_lengths[n - 1] if n > 0 else 0
+            length = lengths[n]
+            residue = (target_length - current_length) / length if length != 0 else 0
+            return self.get_nth_curve_function(n)(residue)
         raise Exception(
             "Not sure how you reached here, please file a bug report at https://github.com/ManimCommunity/manim/issues/new/choose"
         )
@@ -1680,9 +1956,15 @@ class VMobject(Mobject):
         -------
         `list[Point3D_Array]`
             Iterable of the anchors and handles.
+
+        See Also
+        --------
+        :meth:`gen_cubic_bezier_tuples_from_points`
+            Gives the same points grouped by curve, as a single array of
+            shape ``(number of curves, nppcc, dimension)``.
         """
-        nppcc = self.n_points_per_cubic_curve
-        return [self.points[i::nppcc] for i in range(nppcc)]
+        curves = self.gen_cubic_bezier_tuples_from_points(self.points)
+        return list(curves.swapaxes(0, 1))
 
     def get_start_anchors(self) -> Point3D_Array:
         """Returns the start anchors of the bezier curves.
@@ -1705,7 +1987,7 @@ class VMobject(Mobject):
         nppcc = self.n_points_per_cubic_curve
         return self.points[nppcc - 1 :: nppcc]
 
-    def get_anchors(self) -> list[Point3D]:
+    def get_anchors(self) -> Point3D_Array:
         """Returns the anchors of the curves forming the VMobject.
 
         Returns
@@ -1718,13 +2000,15 @@ class VMobject(Mobject):
 
         s = self.get_start_anchors()
         e = self.get_end_anchors()
-        return list(it.chain.from_iterable(zip(s, e, strict=True)))
+        # Interleave the start and end anchors of the curves
+        anchors = np.empty((len(s) + len(e), self.dim), dtype=s.dtype)
+        anchors[::2] = s
+        anchors[1::2] = e
+        return anchors
 
     def get_points_defining_boundary(self) -> Point3D_Array:
         # Probably returns all anchors, but this is weird regarding  the name of the method.
-        return np.array(
-            tuple(it.chain(*(sm.get_anchors() for sm in self.get_family())))
-        )
+        return np.concatenate([sm.get_anchors() for sm in self.get_family()])
 
     def get_arc_length(self, sample_points_per_curve: int | None = None) -> float:
         """Return the approximated length of the whole curve.
@@ -1739,12 +2023,53 @@ class VMobject(Mobject):
         float
             The length of the :class:`VMobject`.
         """
-        return sum(
-            length
-            for _, length in self.get_curve_functions_with_lengths(
-                sample_points=sample_points_per_curve,
-            )
+        return self._get_curve_lengths(sample_points_per_curve).sum()
+
+    def _get_curve_length_pieces(
+        self, sample_points: int | None = None
+    ) -> npt.NDArray[ManimFloat]:
+        """Returns the short line lengths used for length approximation of all
+        the curves of the vmobject.
+
+        Parameters
+        ----------
+        sample_points
+            The number of points to sample on each curve to find its length.
+
+        Returns
+        -------
+        npt.NDArray[ManimFloat]
+            An array of shape ``(num_curves, sample_points - 1)``, whose nth
+            row contains the short length-pieces of the nth curve.
+        """
+        if sample_points is None:
+            sample_points = 10
+
+        # Sample all the curves at once, instead of building a curve function
+        # and measuring it for every curve separately.
+        curves = self.gen_cubic_bezier_tuples_from_points(self.points)
+        samples = (
+            _get_bezier_sampling_matrix(self.n_points_per_cubic_curve, sample_points)
+            @ curves
         )
+        return np.linalg.norm(np.diff(samples, axis=1), axis=2)
+
+    def _get_curve_lengths(
+        self, sample_points: int | None = None
+    ) -> npt.NDArray[ManimFloat]:
+        """Returns the (approximate) lengths of all the curves of the vmobject.
+
+        Parameters
+        ----------
+        sample_points
+            The number of points to sample on each curve to find its length.
+
+        Returns
+        -------
+        npt.NDArray[ManimFloat]
+            The length of every curve.
+        """
+        return self._get_curve_length_pieces(sample_points).sum(axis=1)
 
     # Alignment
     def align_points(self, vmobject: VMobject) -> Self:
@@ -1787,41 +2112,60 @@ class VMobject(Mobject):
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
 
         nppcc = self.n_points_per_cubic_curve
 
         def get_nth_subpath(path_list, n):
             if n >= len(path_list):
-                # Create a null path at the very end
+                # Create a null path at the very end. It is only read from,
+                # so a broadcast view of the last point is enough.
                 if len(path_list) == 0:
-                    return np.tile(np.zeros(3), (nppcc, 1))
-                return np.tile(path_list[-1][-1], (nppcc, 1))
+                    return np.zeros((nppcc, self.dim))
+                return np.broadcast_to(path_list[-1][-1], (nppcc, self.dim))
             path = path_list[n]
             # Check for useless points at the end of the path and remove them
             # https://github.com/ManimCommunity/manim/issues/1959
-            while len(path) > nppcc:
-                # If the last nppc points are all equal to the preceding point
-                if self.consider_points_equals(path[-nppcc:], path[-nppcc - 1]):
-                    path = path[:-nppcc]
-                else:
-                    break
+            # If the last nppc points are all equal to the preceding point,
+            # compare every block of nppc points, counted from the end of the
+            # path, with the point preceding it at once, and cut off all the
+            # trailing blocks that are equal to it.
+            if len(path) > nppcc and self.consider_points_equals(
+                path[-nppcc:], path[-nppcc - 1]
+            ):
+                n_blocks = (len(path) - 1) // nppcc
+                start = len(path) - n_blocks * nppcc
+                blocks = path[start:].reshape(n_blocks, nppcc, -1)
+                preceding_points = path[start - 1 : -nppcc : nppcc]
+                useless = self._consider_points_equals_mask(
+                    blocks, preceding_points[:, np.newaxis]
+                ).all(axis=1)
+                useful = np.flatnonzero(~useless)
+                n_useful = useful[-1] + 1 if len(useful) > 0 else 0
+                path = path[: len(path) - (n_blocks - n_useful) * nppcc]
             return path
 
-        for n in range(n_subpaths):
-            # For each pair of subpaths, add points until they are the same length
-            sp1 = get_nth_subpath(subpaths1, n)
-            sp2 = get_nth_subpath(subpaths2, n)
-            diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
-            diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
+        # Get the Bézier curves of every pair of subpaths
+        curves1 = [
+            self.gen_cubic_bezier_tuples_from_points(get_nth_subpath(subpaths1, n))
+            for n in range(n_subpaths)
+        ]
+        curves2 = [
+            vmobject.gen_cubic_bezier_tuples_from_points(get_nth_subpath(subpaths2, n))
+            for n in range(n_subpaths)
+        ]
+        numbers_of_curves1 = np.array([len(curves) for curves in curves1])
+        numbers_of_curves2 = np.array([len(curves) for curves in curves2])
+        # Add curves to the shorter subpath of each pair until they are the
+        # same length, subdividing the curves of all subpaths at once
+        new_numbers_of_curves = np.maximum(numbers_of_curves1, numbers_of_curves2)
+        for mob, curves, numbers_of_curves in (
+            (self, curves1, numbers_of_curves1),
+            (vmobject, curves2, numbers_of_curves2),
+        ):
+            new_curves = _bezier_remap_groups(
+                np.concatenate(curves), numbers_of_curves, new_numbers_of_curves
+            )
+            mob.set_points(new_curves.reshape(-1, self.dim))
         return self
 
     def insert_n_curves(self, n: int) -> Self:
@@ -1867,7 +2211,8 @@ class VMobject(Mobject):
         if len(points) == 1:
             nppcc = self.n_points_per_cubic_curve
             return np.repeat(points, nppcc * n, 0)
-        bezier_tuples = self.get_cubic_bezier_tuples_from_points(points)
+        # bezier_remap does not modify the tuples, so a view is enough
+        bezier_tuples = self.gen_cubic_bezier_tuples_from_points(points)
         current_number_of_curves = len(bezier_tuples)
         new_number_of_curves = current_number_of_curves + n
         new_bezier_tuples = bezier_remap(bezier_tuples, new_number_of_curves)
@@ -1879,12 +2224,14 @@ class VMobject(Mobject):
         for attr in attrs:
             a1 = getattr(self, attr)
             a2 = getattr(vmobject, attr)
-            if len(a1) > len(a2):
-                new_a2 = stretch_array_to_length(a2, len(a1))
-                setattr(vmobject, attr, new_a2)
-            elif len(a2) > len(a1):
-                new_a1 = stretch_array_to_length(a1, len(a2))
-                setattr(self, attr, new_a1)
+            len1, len2 = len(a1), len(a2)
+            # Usually the arrays are already aligned
+            if len1 == len2:
+                continue
+            if len1 > len2:
+                setattr(vmobject, attr, stretch_array_to_length(a2, len1))
+            else:
+                setattr(self, attr, stretch_array_to_length(a1, len2))
         return self
 
     def get_point_mobject(self, center: Point3DLike | None = None) -> VectorizedPoint:
@@ -1907,16 +2254,12 @@ class VMobject(Mobject):
             "sheen_factor",
         ]
         for attr in attrs:
-            setattr(
-                self,
-                attr,
-                interpolate(getattr(mobject1, attr), getattr(mobject2, attr), alpha),
-            )
+            start = getattr(mobject1, attr)
+            end = getattr(mobject2, attr)
             if alpha == 1.0:
-                val = getattr(mobject2, attr)
-                if isinstance(val, np.ndarray):
-                    val = val.copy()
-                setattr(self, attr, val)
+                setattr(self, attr, end.copy() if isinstance(end, np.ndarray) else end)
+            else:
+                setattr(self, attr, interpolate(start, end, alpha))
         return self
 
     def pointwise_become_partial(
@@ -1983,37 +2326,54 @@ class VMobject(Mobject):
             vmobject.points.copy() if self is vmobject else vmobject.points
         )
 
+        n_points = nppc * (upper_index - lower_index + 1)
+        points = np.empty((n_points, self.dim))
+
         # If both indices coincide, get a part of a single Bézier curve.
         if lower_index == upper_index:
             # Look at the "lower_index"-th Bézier curve and select its part from
             # t=lower_residue to t=upper_residue.
-            self.points = partial_bezier_points(
-                vmobject_points[nppc * lower_index : nppc * (lower_index + 1)],
-                lower_residue,
-                upper_residue,
-            )
+            curve = vmobject_points[nppc * lower_index : nppc * (lower_index + 1)]
+            if nppc in (3, 4):
+                np.matmul(
+                    _get_portion_matrix(nppc, lower_residue, upper_residue),
+                    curve,
+                    out=points,
+                )
+            else:
+                points[:] = partial_bezier_points(curve, lower_residue, upper_residue)
         else:
-            # Allocate space for (upper_index-lower_index+1) Bézier curves.
-            self.points = np.empty((nppc * (upper_index - lower_index + 1), self.dim))
+            # points has space for (upper_index-lower_index+1) Bézier curves.
+            lower_curve = vmobject_points[nppc * lower_index : nppc * (lower_index + 1)]
+            upper_curve = vmobject_points[nppc * upper_index : nppc * (upper_index + 1)]
             # Look at the "lower_index"-th Bezier curve and select its part from
-            # t=lower_residue to t=1. This is the first curve in self.points.
-            self.points[:nppc] = partial_bezier_points(
-                vmobject_points[nppc * lower_index : nppc * (lower_index + 1)],
-                lower_residue,
-                1,
-            )
-            # If there are more curves between the "lower_index"-th and the
-            # "upper_index"-th Béziers, add them all to self.points.
-            self.points[nppc:-nppc] = vmobject_points[
-                nppc * (lower_index + 1) : nppc * upper_index
-            ]
+            # t=lower_residue to t=1. This is the first curve in points.
             # Look at the "upper_index"-th Bézier curve and select its part from
-            # t=0 to t=upper_residue. This is the last curve in self.points.
-            self.points[-nppc:] = partial_bezier_points(
-                vmobject_points[nppc * upper_index : nppc * (upper_index + 1)],
-                0,
-                upper_residue,
-            )
+            # t=0 to t=upper_residue. This is the last curve in points.
+            # For quadratic and cubic Béziers, write these portions directly
+            # into points by multiplying with their portion matrices.
+            if nppc in (3, 4):
+                np.matmul(
+                    _get_portion_matrix(nppc, lower_residue, 1),
+                    lower_curve,
+                    out=points[:nppc],
+                )
+                np.matmul(
+                    _get_portion_matrix(nppc, 0, upper_residue),
+                    upper_curve,
+                    out=points[-nppc:],
+                )
+            else:
+                points[:nppc] = partial_bezier_points(lower_curve, lower_residue, 1)
+                points[-nppc:] = partial_bezier_points(upper_curve, 0, upper_residue)
+            # If there are more curves between the "lower_index"-th and the
+            # "upper_index"-th Béziers, add them all to points.
+            if upper_index - lower_index > 1:
+                np.copyto(
+                    points[nppc:-nppc],
+                    vmobject_points[nppc * (lower_index + 1) : nppc * upper_index],
+                )
+        self.points = points
 
         return self
 
@@ -2087,7 +2447,7 @@ class VMobject(Mobject):
                     self.play(Create(ccw), Create(cw),
                     run_time=4)
         """
-        self.points = self.points[::-1]
+        self.points = np.ascontiguousarray(self.points[::-1])
         return self
 
     def force_direction(self, target_direction: Literal["CW", "CCW"]) -> Self:
@@ -2274,24 +2634,21 @@ class VGroup(VMobject, metaclass=ConvertToOpenGL):
         valid_vmobjects = []
 
         for i, vmobject in enumerate(vmobjects):
+            # The common case of a single VMobject only needs one type check
             if isinstance(vmobject, vmobject_render_type):
                 valid_vmobjects.append(vmobject)
-            elif isinstance(vmobject, Iterable) and not isinstance(
-                vmobject, (Mobject, OpenGLMobject)
-            ):
-                for j, subvmobject in enumerate(vmobject):
-                    if not isinstance(subvmobject, vmobject_render_type):
-                        raise TypeError(get_type_error_message(subvmobject, (i, j)))
-                    valid_vmobjects.append(subvmobject)
-            elif isinstance(vmobject, Iterable) and isinstance(
-                vmobject, (Mobject, OpenGLMobject)
-            ):
+            elif not isinstance(vmobject, Iterable):
+                raise TypeError(get_type_error_message(vmobject, (i, 0)))
+            elif isinstance(vmobject, (Mobject, OpenGLMobject)):
                 raise TypeError(
                     f"{get_type_error_message(vmobject, (i, 0))} "
                     "You can try adding this value into a Group instead."
                 )
             else:
-                raise TypeError(get_type_error_message(vmobject, (i, 0)))
+                for j, subvmobject in enumerate(vmobject):
+                    if not isinstance(subvmobject, vmobject_render_type):
+                        raise TypeError(get_type_error_message(subvmobject, (i, j)))
+                    valid_vmobjects.append(subvmobject)
 
         return super().add(*valid_vmobjects)
 
@@ -2479,7 +2836,11 @@ class VDict(VMobject, metaclass=ConvertToOpenGL):
             square_obj = Square()
             my_dict.add([("s", square_obj)])
         """
-        for key, value in dict(mapping_or_iterable).items():
+        # Mappings can be iterated directly. Other iterables still go through
+        # a dict, so that only the last value of a repeated key is added.
+        if not isinstance(mapping_or_iterable, Mapping):
+            mapping_or_iterable = dict(mapping_or_iterable)
+        for key, value in mapping_or_iterable.items():
             self.add_key_value_pair(key, value)
 
         return self
@@ -2694,7 +3055,7 @@ class VectorizedPoint(VMobject, metaclass=ConvertToOpenGL):
             stroke_width=stroke_width,
             **kwargs,
         )
-        self.set_points(np.array([location]))
+        self.set_points([location])
 
     basecls = OpenGLVMobject if config.renderer == RendererType.OPENGL else VMobject
 
@@ -2707,10 +3068,10 @@ class VectorizedPoint(VMobject, metaclass=ConvertToOpenGL):
         return self.artificial_height
 
     def get_location(self) -> Point3D:
-        return np.array(self.points[0])
+        return self.points[0].copy()
 
     def set_location(self, new_loc: Point3D) -> Self:
-        self.set_points(np.array([new_loc]))
+        self.set_points([new_loc])
         return self
 
 
@@ -2733,12 +3094,15 @@ class CurvesAsSubmobjects(VGroup):
 
     def __init__(self, vmobject: VMobject, **kwargs) -> None:
         super().__init__(**kwargs)
-        tuples = vmobject.get_cubic_bezier_tuples()
-        for tup in tuples:
+        # Every part gets the same style, so only look it up once
+        style = vmobject.get_style()
+        parts = []
+        for tup in vmobject.gen_cubic_bezier_tuples_from_points(vmobject.points):
             part = VMobject()
             part.set_points(tup)
-            part.match_style(vmobject)
-            self.add(part)
+            part.set_style(**style, family=False)
+            parts.append(part)
+        self.add(*parts)
 
     def point_from_proportion(self, alpha: float) -> Point3D:
         """Gets the point at a proportion along the path of the :class:`CurvesAsSubmobjects`.
@@ -2769,21 +3133,18 @@ class CurvesAsSubmobjects(VGroup):
         if alpha == 1:
             return submobjs_with_pts[-1].points[-1]
 
-        submobjs_arc_lengths = tuple(
-            part.get_arc_length() for part in submobjs_with_pts
+        submobjs_arc_lengths = np.array(
+            [part.get_arc_length() for part in submobjs_with_pts]
         )
 
-        total_length = sum(submobjs_arc_lengths)
-        target_length = alpha * total_length
-        current_length = 0
+        cumulative_lengths = np.cumsum(submobjs_arc_lengths)
+        target_length = alpha * cumulative_lengths[-1]
 
-        for i, part in enumerate(submobjs_with_pts):
-            part_length = submobjs_arc_lengths[i]
-            if current_length + part_length >= target_length:
-                residue = (target_length - current_length) / part_length
-                return part.point_from_proportion(residue)
-
-            current_length += part_length
+        # Find the first part whose end reaches the target length
+        i = int(np.searchsorted(cumulative_lengths, target_length))
+        current_length = cumulative_lengths[i - 1] if i > 0 else 0
+        residue = (target_length - current_length) / submobjs_arc_lengths[i]
+        return submobjs_with_pts[i].point_from_proportion(residue)
 
     def _throw_error_if_no_submobjects(self):
         if len(self.submobjects) == 0:
@@ -2889,9 +3250,10 @@ class DashedVMobject(VMobject, metaclass=ConvertToOpenGL):
         r = self.dashed_ratio
         n = self.num_dashes
         if n > 0:
+            closed = vmobject.is_closed()
             # Assuming total length is 1
             dash_len = r / n
-            if vmobject.is_closed():
+            if closed:  # noqa: SIM108
                 void_len = (1 - r) / n
             else:
                 void_len = 1 - r if n == 1 else (1 - r) / (n - 1)
@@ -2899,33 +3261,31 @@ class DashedVMobject(VMobject, metaclass=ConvertToOpenGL):
             period = dash_len + void_len
             phase_shift = (dash_offset % 1) * period
 
-            if vmobject.is_closed():  # noqa: SIM108
+            if closed:  # noqa: SIM108
                 # closed curves have equal amount of dashes and voids
                 pattern_len = 1
             else:
                 # open curves start and end with a dash, so the whole dash pattern with the last void is longer
                 pattern_len = 1 + void_len
 
-            dash_starts = [((i * period + phase_shift) % pattern_len) for i in range(n)]
-            dash_ends = [
-                ((i * period + dash_len + phase_shift) % pattern_len) for i in range(n)
-            ]
+            dash_starts = (np.arange(n) * period + phase_shift) % pattern_len
+            dash_ends = (np.arange(n) * period + dash_len + phase_shift) % pattern_len
 
             # closed shapes can handle overflow at the 0-point
             # open shapes need special treatment for it
-            if not vmobject.is_closed():
+            if not closed:
                 # due to phase shift being [0...1] range, always the last dash element needs attention for overflow
                 # if an entire dash moves out of the shape end:
                 if dash_ends[-1] > 1 and dash_starts[-1] > 1:
                     # remove the last element since it is out-of-bounds
-                    dash_ends.pop()
-                    dash_starts.pop()
+                    dash_ends = dash_ends[:-1]
+                    dash_starts = dash_starts[:-1]
                 elif dash_ends[-1] < dash_len:  # if it overflowed
                     if (
                         dash_starts[-1] < 1
                     ):  # if the beginning of the piece is still in range
-                        dash_starts.append(0)
-                        dash_ends.append(dash_ends[-1])
+                        dash_starts = np.append(dash_starts, 0)
+                        dash_ends = np.append(dash_ends, dash_ends[-1])
                         dash_ends[-2] = 1
                     else:
                         dash_starts[-1] = 0
@@ -2933,41 +3293,34 @@ class DashedVMobject(VMobject, metaclass=ConvertToOpenGL):
                     dash_ends[-1] = 1
 
             if equal_lengths:
-                # calculate the entire length by adding up short line-pieces
-                norms = np.array(0)
-                for k in range(vmobject.get_num_curves()):
-                    norms = np.append(norms, vmobject.get_nth_curve_length_pieces(k))
+                # calculate the entire length by adding up short line-pieces,
+                # starting from a length of 0 at the start of the curve
+                if isinstance(vmobject, VMobject):
+                    # measure all curves at once
+                    pieces = [vmobject._get_curve_length_pieces().ravel()]
+                else:
+                    pieces = [
+                        vmobject.get_nth_curve_length_pieces(k)
+                        for k in range(vmobject.get_num_curves())
+                    ]
+                norms = np.concatenate([[0.0], *pieces])
                 # add up length-pieces in array form
                 length_vals = np.cumsum(norms)
                 ref_points = np.linspace(0, 1, length_vals.size)
                 curve_length = length_vals[-1]
-                self.add(
-                    *(
-                        vmobject.get_subcurve(
-                            np.interp(
-                                dash_starts[i] * curve_length,
-                                length_vals,
-                                ref_points,
-                            ),
-                            np.interp(
-                                dash_ends[i] * curve_length,
-                                length_vals,
-                                ref_points,
-                            ),
-                        )
-                        for i in range(len(dash_starts))
-                    )
+                # map the lengths of all dash ends to curve proportions at once
+                dash_starts = np.interp(
+                    np.multiply(dash_starts, curve_length), length_vals, ref_points
                 )
-            else:
-                self.add(
-                    *(
-                        vmobject.get_subcurve(
-                            dash_starts[i],
-                            dash_ends[i],
-                        )
-                        for i in range(len(dash_starts))
-                    )
+                dash_ends = np.interp(
+                    np.multiply(dash_ends, curve_length), length_vals, ref_points
                 )
+            self.add(
+                *(
+                    vmobject.get_subcurve(dash_start, dash_end)
+                    for dash_start, dash_end in zip(dash_starts, dash_ends, strict=True)
+                )
+            )
         # Family is already taken care of by get_subcurve
         # implementation
         if config.renderer == RendererType.OPENGL:
@@ -81,11 +81,8 @@ class ZoomedScene(MovingCameraScene):
         zoomed_display_center: Point3DLike | None = None,
         zoomed_display_corner: Vector3D = UP + RIGHT,
         zoomed_display_corner_buff: float = DEFAULT_MOBJECT_TO_EDGE_BUFFER,
-        zoomed_camera_config: dict[str, Any] = {
-            "default_frame_stroke_width": 2,
-            "background_opacity": 1,
-        },
-        zoomed_camera_image_mobject_config: dict[str, Any] = {},
+        zoomed_camera_config: dict[str, Any] | None = None,
+        zoomed_camera_image_mobject_config: dict[str, Any] | None = None,
         zoomed_camera_frame_starting_position: Point3DLike = ORIGIN,
         zoom_factor: float = 0.15,
         image_frame_stroke_width: float = 3,
@@ -97,6 +94,13 @@ class ZoomedScene(MovingCameraScene):
         self.zoomed_display_center = zoomed_display_center
         self.zoomed_display_corner = zoomed_display_corner
         self.zoomed_display_corner_buff = zoomed_display_corner_buff
+        if zoomed_camera_config is None:
+            zoomed_camera_config = {
+                "default_frame_stroke_width": 2,
+                "background_opacity": 1,
+            }
+        if zoomed_camera_image_mobject_config is None:
+            zoomed_camera_image_mobject_config = {}
         self.zoomed_camera_config = zoomed_camera_config
         self.zoomed_camera_image_mobject_config = zoomed_camera_image_mobject_config
         self.zoomed_camera_frame_starting_position = (
@@ -21,7 +21,7 @@ __all__ = [
 
 
 from collections.abc import Callable, Sequence
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import TYPE_CHECKING, overload
 
 import numpy as np
@@ -29,6 +29,8 @@ import numpy as np
 from manim.utils.simple_functions import choose
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from manim.typing import (
         BezierPoints,
         BezierPoints_Array,
@@ -178,6 +180,68 @@ def bezier(
     return nth_grade_bezier
 
 
+@lru_cache(maxsize=128)
+def _get_portion_matrix(n_points: int, a: float, b: float) -> MatrixMN:
+    """Gets the matrix which, upon multiplying the control points of a
+    Bézier curve of ``n_points`` control points, returns the control
+    points of its portion with :math:`t` between ``a`` and ``b``.
+
+    Auxiliary function for :func:`partial_bezier_points`. See its
+    docstrings for an explanation of the matrix build process.
+
+    Parameters
+    ----------
+    n_points
+        The number of control points of the Bézier curve. This function
+        only handles quadratic and cubic Béziers, with 3 and 4 points.
+    a
+        The lower bound of the desired portion.
+    b
+        The upper bound of the desired portion.
+
+    Returns
+    -------
+    MatrixMN
+        The ``(n_points, n_points)`` portion matrix.
+
+    Notes
+    -----
+    The matrices are memoized, because animations like :class:`.Create`
+    request the same portions for every submobject with the same number
+    of curves, and the full-curve portion with ``b=1`` in every frame.
+    """
+    ma, mb = 1 - a, 1 - b
+
+    if n_points == 4:
+        a2, b2, ma2, mb2 = a * a, b * b, ma * ma, mb * mb
+        a3, b3, ma3, mb3 = a2 * a, b2 * b, ma2 * ma, mb2 * mb
+
+        portion_matrix = np.array(
+            [
+                [ma3, 3 * ma2 * a, 3 * ma * a2, a3],
+                [ma2 * mb, 2 * ma * a * mb + ma2 * b, a2 * mb + 2 * ma * a * b, a2 * b],
+                [ma * mb2, a * mb2 + 2 * ma * mb * b, 2 * a * mb * b + ma * b2, a * b2],
+                [mb3, 3 * mb2 * b, 3 * mb * b2, b3],
+            ]
+        )
+    elif n_points == 3:
+        portion_matrix = np.array(
+            [
+                [ma * ma, 2 * a * ma, a * a],
+                [ma * mb, a * mb + ma * b, a * b],
+                [mb * mb, 2 * b * mb, b * b],
+            ]
+        )
+    else:
+        raise NotImplementedError(
+            "This function only supports Bézier curves with 3 or 4 control points."
+        )
+
+    # The matrix is shared between calls, so it must not be modified
+    portion_matrix.flags.writeable = False
+    return portion_matrix
+
+
 def partial_bezier_points(points: BezierPointsLike, a: float, b: float) -> BezierPoints:
     r"""Given an array of ``points`` which define a Bézier curve, and two numbers :math:`a, b`
     such that :math:`0 \le a < b \le 1`, return an array of the same size, which describes the
@@ -320,32 +384,8 @@ def partial_bezier_points(points: BezierPointsLike, a: float, b: float) -> Bezie
     points = np.asarray(points)
     degree = points.shape[0] - 1
 
-    if degree == 3:
-        ma, mb = 1 - a, 1 - b
-        a2, b2, ma2, mb2 = a * a, b * b, ma * ma, mb * mb
-        a3, b3, ma3, mb3 = a2 * a, b2 * b, ma2 * ma, mb2 * mb
-
-        portion_matrix = np.array(
-            [
-                [ma3, 3 * ma2 * a, 3 * ma * a2, a3],
-                [ma2 * mb, 2 * ma * a * mb + ma2 * b, a2 * mb + 2 * ma * a * b, a2 * b],
-                [ma * mb2, a * mb2 + 2 * ma * mb * b, 2 * a * mb * b + ma * b2, a * b2],
-                [mb3, 3 * mb2 * b, 3 * mb * b2, b3],
-            ]
-        )
-        return portion_matrix @ points
-
-    if degree == 2:
-        ma, mb = 1 - a, 1 - b
-
-        portion_matrix = np.array(
-            [
-                [ma * ma, 2 * a * ma, a * a],
-                [ma * mb, a * mb + ma * b, a * b],
-                [mb * mb, 2 * b * mb, b * b],
-            ]
-        )
-        return portion_matrix @ points
+    if degree in (2, 3):
+        return _get_portion_matrix(degree + 1, a, b) @ points
 
     if degree == 1:
         direction = points[1] - points[0]
@@ -978,34 +1018,79 @@ def bezier_remap(
         containing the new Bézier curves after the remap.
     """
     bezier_tuples = np.asarray(bezier_tuples)
-    current_number_of_curves, nppc, dim = bezier_tuples.shape
-    # This is an array with values ranging from 0
-    # up to curr_num_curves,  with repeats such that
-    # its total length is target_num_curves.  For example,
-    # with curr_num_curves = 10, target_num_curves = 15, this
-    # would be [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9].
-    repeat_indices = (
-        np.arange(new_number_of_curves, dtype="i") * current_number_of_curves
-    ) // new_number_of_curves
-
-    # If the nth term of this list is k, it means
-    # that the nth curve of our path should be split
-    # into k pieces.
-    # In the above example our array had the following elements
-    # [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9]
-    # We have two 0s, one 1, two 2s and so on.
-    # The split factors array would hence be:
+    return _bezier_remap_groups(
+        bezier_tuples, [len(bezier_tuples)], [new_number_of_curves]
+    )
+
+
+def _bezier_remap_groups(
+    bezier_tuples: BezierPointsLike_Array,
+    current_numbers_of_curves: Sequence[int] | npt.NDArray[np.int_],
+    new_numbers_of_curves: Sequence[int] | npt.NDArray[np.int_],
+) -> BezierPoints_Array:
+    """Remaps several groups of consecutive Bézier curves at once, like
+    calling :func:`bezier_remap` on each group and concatenating the results.
+
+    Parameters
+    ----------
+    bezier_tuples
+        An array of shape ``(current_number_of_curves, nppc, dim)`` with the
+        curves of all groups, one group after the other.
+    current_numbers_of_curves
+        The number of curves of each group in ``bezier_tuples``.
+    new_numbers_of_curves
+        The number of curves each group must be remapped to.
+
+    Returns
+    -------
+    :class:`~.BezierPoints_Array`
+        The new array of shape ``(sum(new_numbers_of_curves), nppc, dim)``,
+        containing the new Bézier curves of all groups after the remap.
+    """
+    bezier_tuples = np.asarray(bezier_tuples)
+    _, nppc, dim = bezier_tuples.shape
+    current_numbers_of_curves = np.asarray(current_numbers_of_curves, dtype=int)
+    new_numbers_of_curves = np.asarray(new_numbers_of_curves, dtype=int)
+
+    # For every curve, the number of curves of its group before and after the
+    # remap, and its index inside its group.
+    current = np.repeat(current_numbers_of_curves, current_numbers_of_curves)
+    new = np.repeat(new_numbers_of_curves, current_numbers_of_curves)
+    group_starts = np.cumsum(current_numbers_of_curves) - current_numbers_of_curves
+    indices = np.arange(len(current)) - np.repeat(
+        group_starts, current_numbers_of_curves
+    )
+
+    # The jth new curve of a group is a piece of its (j * current // new)-th
+    # curve. For example, with current = 10 and new = 15, the new curves are
+    # pieces of the curves [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9].
+    # Therefore, the ith curve must be split into as many pieces as there
+    # are j such that i * new <= j * current < (i + 1) * new, which is
+    # ceil((i + 1) * new / current) - ceil(i * new / current).
+    # In the above example, the split factors would hence be:
     # [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-    split_factors = np.zeros(current_number_of_curves, dtype="i")
-    np.add.at(split_factors, repeat_indices, 1)
-
-    new_tuples = np.empty((new_number_of_curves, nppc, dim))
-    index = 0
-    for curve, sf in zip(bezier_tuples, split_factors, strict=True):
-        new_tuples[index : index + sf] = subdivide_bezier(curve, sf).reshape(
-            sf, nppc, dim
-        )
-        index += sf
+    split_factors = (-indices * new) // current - (-(indices + 1) * new) // current
+
+    # The index of new_tuples where the pieces of each curve start
+    start_indices = np.cumsum(split_factors) - split_factors
+
+    # There are only a few different split factors, so instead of
+    # subdividing each curve on its own, subdivide all curves sharing a
+    # split factor with a single product with their subdivision matrix.
+    new_tuples = np.empty((split_factors.sum(), nppc, dim))
+    for sf in np.unique(split_factors).tolist():
+        if sf == 0:
+            continue
+        curve_indices = np.flatnonzero(split_factors == sf)
+        curves = bezier_tuples[curve_indices]
+        if sf == 1:
+            pieces = curves
+        elif nppc <= 4:
+            pieces = _get_subdivision_matrix(nppc, sf) @ curves
+        else:
+            pieces = np.array([subdivide_bezier(curve, sf) for curve in curves])
+        new_indices = start_indices[curve_indices, np.newaxis] + np.arange(sf)
+        new_tuples[new_indices] = pieces.reshape(-1, sf, nppc, dim)
 
     return new_tuples
 
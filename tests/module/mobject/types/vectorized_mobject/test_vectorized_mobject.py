@@ -628,3 +628,62 @@ def test_pointwise_become_partial_where_vmobject_is_self():
         ]
     )
     np.testing.assert_allclose(sq.points, expected_points)
+
+
+def test_append_points_reuses_buffer_without_aliasing():
+    vmob = VMobject()
+    vmob.start_new_path(np.array([0.0, 0.0, 0.0]))
+    expected = [vmob.points.copy()]
+    for i in range(1, 20):
+        new_points = np.full((3, 3), float(i))
+        vmob.append_points(new_points)
+        expected.append(new_points)
+    np.testing.assert_array_equal(vmob.points, np.concatenate(expected))
+
+    # Neither a copy nor a previously returned view may be affected by
+    # appending to the original mobject.
+    copy = vmob.copy()
+    view = vmob.points
+    vmob.append_points(np.ones((3, 3)))
+    assert len(copy.points) == len(view) == len(vmob.points) - 3
+    copy.append_points(np.zeros((3, 3)))
+    np.testing.assert_array_equal(vmob.points[-3:], np.ones((3, 3)))
+
+    # Mobjects sharing the same points must not grow into the same buffer.
+    other = VMobject()
+    other.points = vmob.points
+    other.append_points(np.full((3, 3), 2.0))
+    vmob.append_points(np.full((3, 3), 3.0))
+    np.testing.assert_array_equal(other.points[-3:], np.full((3, 3), 2.0))
+    np.testing.assert_array_equal(vmob.points[-3:], np.full((3, 3), 3.0))
+
+
+def test_get_arc_length():
+    line = VMobject().set_points_as_corners([[0, 0, 0], [3, 4, 0], [3, 0, 0]])
+    assert line.get_arc_length() == pytest.approx(9)
+
+    circle = Circle(radius=2)
+    assert circle.get_arc_length() == pytest.approx(
+        sum(circle.get_nth_curve_length(n) for n in range(circle.get_num_curves()))
+    )
+    assert circle.get_arc_length(sample_points_per_curve=100) == pytest.approx(
+        4 * PI, rel=1e-3
+    )
+    assert VMobject().get_arc_length() == 0
+
+
+def test_make_jagged_and_make_smooth():
+    corners = np.array([[0, 0, 0], [1, 2, 0], [3, 1, 0], [4, 4, 0]], dtype=float)
+    vmob = VMobject().set_points_smoothly(corners)
+    anchors = vmob.get_anchors()
+
+    vmob.make_jagged()
+    np.testing.assert_allclose(
+        vmob.points, VMobject().set_points_as_corners(corners).points
+    )
+    np.testing.assert_allclose(vmob.get_anchors(), anchors)
+
+    vmob.make_smooth()
+    np.testing.assert_allclose(
+        vmob.points, VMobject().set_points_smoothly(corners).points
+    )
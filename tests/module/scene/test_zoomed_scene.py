@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from manim import ZoomedScene
+
+
+def test_default_configs_are_not_shared():
+    scene1 = ZoomedScene()
+    scene2 = ZoomedScene()
+    scene1.zoomed_camera_config["default_frame_stroke_width"] = 5
+    scene1.zoomed_camera_config["background_opacity"] = 0.5
+    scene1.zoomed_camera_image_mobject_config["scale_to_resolution"] = 720
+
+    assert scene2.zoomed_camera_config == {
+        "default_frame_stroke_width": 2,
+        "background_opacity": 1,
+    }
+    assert scene2.zoomed_camera_image_mobject_config == {}
+    assert ZoomedScene().zoomed_camera_config == scene2.zoomed_camera_config